@@ -0,0 +1,117 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import functools
+import hashlib
+import os
+from types import MappingProxyType
+
+import pytest
+
+from python_project_generator.project_generator import ProjectGenerator, TemplateManager
+
+
+@functools.lru_cache(maxsize=None)
+def _all_template_ids():
+    """Return the ids of every registered template, computed on first use."""
+    return tuple(TemplateManager().get_available_templates().keys())
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize any test that takes ``template_id`` over all templates."""
+    if "template_id" in metafunc.fixturenames:
+        metafunc.parametrize("template_id", _all_template_ids())
+
+
+@pytest.fixture(scope="session")
+def default_features():
+    """Feature flags for tests that do not exercise a particular feature."""
+    return MappingProxyType({
+        "cli": True,
+        "tests": True,
+        "pypi_packaging": True,
+        "readme": True,
+        "gitignore": True,
+    })
+
+
+@pytest.fixture(scope="session")
+def metadata():
+    """Project metadata shared by every generated test project.
+
+    The values differ from the generator's defaults so tests can tell they
+    were actually injected.
+    """
+    return MappingProxyType({
+        "author": "Jane Doe",
+        "email": "jane@example.com",
+        "description": "A test project for the generator suite",
+        "version": "2.5.0",
+    })
+
+
+@pytest.fixture(scope="session")
+def project_generator():
+    """A single stateless ProjectGenerator shared by the whole session."""
+    return ProjectGenerator()
+
+
+@pytest.fixture(scope="session")
+def template_manager():
+    """A single TemplateManager shared by the whole session."""
+    return TemplateManager()
+
+
+@pytest.fixture(scope="session")
+def generated_project(tmp_path_factory, project_generator):
+    """Return a callable that generates a project once per unique set of inputs.
+
+    Projects are cached for the whole session and keyed by (template_id,
+    project_name, features, metadata). Tests that only assert on the generated
+    structure share the same directory, so they must treat it as read-only.
+
+    Under pytest-xdist the store lives in the run's shared base temp dir, so a
+    project generated by one worker is reused by the others. Each project is
+    built in a worker-private dir and published with an atomic rename.
+    """
+    store = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        store = store.parent
+    store = store / "generated_projects"
+    store.mkdir(exist_ok=True)
+    cache = {}
+
+    def _get(template_id, project_name, features, metadata):
+        key = (
+            template_id,
+            project_name,
+            frozenset(features.items()),
+            frozenset(metadata.items()),
+        )
+        project_dir = cache.get(key)
+        if project_dir is None:
+            digest = hashlib.sha1(
+                repr((project_name, sorted(features.items()), sorted(metadata.items()))).encode()
+            ).hexdigest()[:12]
+            target = store / f"{template_id}-{digest}"
+            if not target.exists():
+                staging = tmp_path_factory.mktemp(template_id)
+                result = project_generator.generate_project(
+                    project_name=project_name,
+                    output_dir=staging,
+                    template_id=template_id,
+                    features=dict(features),
+                    metadata=dict(metadata),
+                )
+                assert result is True, f"Template '{template_id}' failed to generate"
+                try:
+                    os.rename(staging, target)
+                except OSError:
+                    # Another worker published the same project first.
+                    if not target.exists():
+                        raise
+            project_dir = cache[key] = target / project_name
+        return project_dir
+
+    return _get
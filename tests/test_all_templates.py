@@ -4,100 +4,54 @@ Parameterized generation tests for all supported template types.
 Every template registered in TemplateManager is tested to ensure it:
 1. Generates successfully (returns True)
 2. Creates a project directory with at least one file
-3. Produces template-specific structure where applicable
-"""
-
-import sys
-import tempfile
-import shutil
-import unittest
-from pathlib import Path
-
-import pytest
+3. Has name, description, type, and features in its template info
+4. Produces template-specific structure where applicable
 
-_ROOT = Path(__file__).resolve().parents[1]
-_SRC = _ROOT / "src"
-if str(_SRC) not in sys.path:
-    sys.path.insert(0, str(_SRC))
+Tests taking a ``template_id`` argument are parametrized over every registered
+template by ``pytest_generate_tests`` in conftest.py.
+"""
 
-from python_project_generator.project_generator import ProjectGenerator, TemplateManager
+from types import MappingProxyType
 
-METADATA = {
-    "author": "Test Author",
-    "email": "test@example.com",
-    "description": "A test project",
-    "version": "0.1.0",
-}
+# Read-only so the shared inputs (and the generated_project cache keys built
+# from them) cannot drift between tests. ``default_features`` and ``metadata``
+# come from conftest.py.
+_WEB_FEATURES = MappingProxyType({
+    "web_framework": True,
+    "tests": True,
+    "readme": True,
+    "gitignore": True,
+})
 
-DEFAULT_FEATURES = {
+_CLI_FEATURES = MappingProxyType({
     "cli": True,
     "tests": True,
-    "pypi_packaging": True,
     "readme": True,
     "gitignore": True,
-}
-
-ALL_TEMPLATE_IDS = list(TemplateManager().get_available_templates().keys())
-
-
-class TestAllTemplatesGenerate(unittest.TestCase):
-    """Every registered template should generate without errors."""
+})
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
 
-    def tearDown(self):
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+def test_template_end_to_end(
+    template_id, tmp_path, project_generator, template_manager, default_features, metadata
+):
+    """Each template generates a non-empty project and has complete template info.
 
-    def _generate(self, template_id: str, project_name: str = "test_proj"):
-        return self.generator.generate_project(
-            project_name=project_name,
-            output_dir=self.temp_dir,
-            template_id=template_id,
-            features=DEFAULT_FEATURES,
-            metadata=METADATA,
-        )
-
-
-@pytest.mark.parametrize("template_id", ALL_TEMPLATE_IDS)
-def test_template_generates_successfully(template_id, tmp_path):
-    """Each template returns True from generate_project()."""
-    gen = ProjectGenerator()
-    result = gen.generate_project(
+    The three checks share one generation so every template is only built once.
+    """
+    result = project_generator.generate_project(
         project_name="gen_test",
         output_dir=tmp_path,
         template_id=template_id,
-        features=DEFAULT_FEATURES,
-        metadata=METADATA,
+        features=default_features,
+        metadata=metadata,
     )
     assert result is True, f"Template '{template_id}' failed to generate"
 
-
-@pytest.mark.parametrize("template_id", ALL_TEMPLATE_IDS)
-def test_template_creates_project_directory(template_id, tmp_path):
-    """Each template creates a project directory."""
-    gen = ProjectGenerator()
-    gen.generate_project(
-        project_name="dir_test",
-        output_dir=tmp_path,
-        template_id=template_id,
-        features=DEFAULT_FEATURES,
-        metadata=METADATA,
-    )
-    project_dir = tmp_path / "dir_test"
+    project_dir = tmp_path / "gen_test"
     assert project_dir.exists(), f"Template '{template_id}' did not create project directory"
-    files = list(project_dir.rglob("*"))
-    assert len(files) > 0, f"Template '{template_id}' created an empty project"
+    assert any(project_dir.iterdir()), f"Template '{template_id}' created an empty project"
 
-
-@pytest.mark.parametrize("template_id", ALL_TEMPLATE_IDS)
-def test_template_info_has_required_fields(template_id):
-    """Each template entry has name, description, type, and features."""
-    tm = TemplateManager()
-    templates = tm.get_available_templates()
-    info = templates[template_id]
+    info = template_manager.get_available_templates()[template_id]
     for field in ("name", "description", "type", "features"):
         assert field in info, f"Template '{template_id}' missing field '{field}'"
     assert isinstance(info["features"], list)
@@ -105,183 +59,98 @@ def test_template_info_has_required_fields(template_id):
 
 
 # --- Template-specific structure tests ---
+#
+# These only assert on the generated layout, so they share session-cached
+# projects via the ``generated_project`` fixture instead of regenerating.
 
 
-class TestFlaskTemplateStructure(unittest.TestCase):
+class TestFlaskTemplateStructure:
     """Flask template generates Flask-specific files."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def test_flask_has_app_factory_and_templates(self):
-        self.generator.generate_project(
-            project_name="flask_app",
-            output_dir=self.temp_dir,
-            template_id="flask-web-app",
-            features={"web_framework": True, "tests": True, "readme": True, "gitignore": True},
-            metadata=METADATA,
+    def test_flask_has_app_factory_and_templates(self, generated_project, metadata):
+        proj = generated_project(
+            "flask-web-app",
+            "flask_app",
+            _WEB_FEATURES,
+            metadata,
         )
-        proj = self.temp_dir / "flask_app"
         app_dir = proj / "flask_app"
-        self.assertTrue(app_dir.exists(), "Flask app dir missing")
-        self.assertTrue((app_dir / "__init__.py").exists())
-        self.assertTrue((app_dir / "config.py").exists())
-        self.assertTrue((app_dir / "templates").exists())
-        self.assertTrue((app_dir / "static").exists())
-        self.assertTrue((proj / "run.py").exists())
+        assert app_dir.exists(), "Flask app dir missing"
+        assert (app_dir / "__init__.py").exists()
+        assert (app_dir / "config.py").exists()
+        assert (app_dir / "templates").exists()
+        assert (app_dir / "static").exists()
+        assert (proj / "run.py").exists()
 
 
-class TestFastAPITemplateStructure(unittest.TestCase):
+class TestFastAPITemplateStructure:
     """FastAPI template generates API-specific files."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def test_fastapi_has_app_and_routes(self):
-        self.generator.generate_project(
-            project_name="api_app",
-            output_dir=self.temp_dir,
-            template_id="fastapi-web-api",
-            features={"web_framework": True, "tests": True, "readme": True, "gitignore": True},
-            metadata=METADATA,
+    def test_fastapi_has_app_and_routes(self, generated_project, metadata):
+        proj = generated_project(
+            "fastapi-web-api",
+            "api_app",
+            _WEB_FEATURES,
+            metadata,
         )
-        proj = self.temp_dir / "api_app"
         app_dir = proj / "api_app"
-        self.assertTrue(app_dir.exists(), "FastAPI app dir missing")
-        self.assertTrue((app_dir / "__init__.py").exists())
+        assert app_dir.exists(), "FastAPI app dir missing"
+        assert (app_dir / "__init__.py").exists()
 
 
-class TestDataScienceTemplateStructure(unittest.TestCase):
+class TestDataScienceTemplateStructure:
     """Data science template generates notebook/analysis structure."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def test_data_science_has_notebooks_and_data(self):
-        self.generator.generate_project(
-            project_name="ds_project",
-            output_dir=self.temp_dir,
-            template_id="data-science-project",
-            features=DEFAULT_FEATURES,
-            metadata=METADATA,
-        )
-        proj = self.temp_dir / "ds_project"
-        self.assertTrue(proj.exists())
+    def test_data_science_has_notebooks_and_data(
+        self, generated_project, default_features, metadata
+    ):
+        proj = generated_project("data-science-project", "ds_project", default_features, metadata)
+        assert proj.exists()
         has_notebooks = (proj / "notebooks").exists()
         has_data = (proj / "data").exists()
-        self.assertTrue(
-            has_notebooks or has_data or (proj / "src").exists(),
-            "Data science project should have notebooks, data, or src directory",
+        assert has_notebooks or has_data or (proj / "src").exists(), (
+            "Data science project should have notebooks, data, or src directory"
         )
 
 
-class TestCLIToolTemplateStructure(unittest.TestCase):
+class TestCLIToolTemplateStructure:
     """CLI tool template generates click-based CLI structure."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def test_cli_tool_has_cli_module(self):
-        self.generator.generate_project(
-            project_name="my_cli",
-            output_dir=self.temp_dir,
-            template_id="cli-tool",
-            features={"cli": True, "tests": True, "readme": True, "gitignore": True},
-            metadata=METADATA,
+    def test_cli_tool_has_cli_module(self, generated_project, metadata):
+        proj = generated_project(
+            "cli-tool",
+            "my_cli",
+            _CLI_FEATURES,
+            metadata,
         )
-        proj = self.temp_dir / "my_cli"
-        self.assertTrue(proj.exists())
+        assert proj.exists()
         package_dir = proj / "src" / "my_cli"
-        self.assertTrue(package_dir.exists())
-        self.assertTrue((package_dir / "cli.py").exists(), "CLI tool should have cli.py")
+        assert package_dir.exists()
+        assert (package_dir / "cli.py").exists(), "CLI tool should have cli.py"
 
 
-class TestBinaryExtensionTemplateStructure(unittest.TestCase):
+class TestBinaryExtensionTemplateStructure:
     """Binary extension template generates C extension structure."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def test_binary_extension_has_ext_dir(self):
-        self.generator.generate_project(
-            project_name="binext",
-            output_dir=self.temp_dir,
-            template_id="binary-extension",
-            features=DEFAULT_FEATURES,
-            metadata=METADATA,
-        )
-        proj = self.temp_dir / "binext"
+    def test_binary_extension_has_ext_dir(self, generated_project, default_features, metadata):
+        proj = generated_project("binary-extension", "binext", default_features, metadata)
         ext_dir = proj / "src" / "binext" / "ext"
-        self.assertTrue(ext_dir.exists(), "Binary extension should have ext/ directory")
+        assert ext_dir.exists(), "Binary extension should have ext/ directory"
 
 
-class TestNamespacePackageTemplateStructure(unittest.TestCase):
+class TestNamespacePackageTemplateStructure:
     """Namespace package template generates namespace structure."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    def test_namespace_package_generates(self, generated_project, default_features, metadata):
+        proj = generated_project("namespace-package", "ns_pkg", default_features, metadata)
+        assert proj.exists()
 
-    def test_namespace_package_generates(self):
-        result = self.generator.generate_project(
-            project_name="ns_pkg",
-            output_dir=self.temp_dir,
-            template_id="namespace-package",
-            features=DEFAULT_FEATURES,
-            metadata=METADATA,
-        )
-        self.assertTrue(result)
-        proj = self.temp_dir / "ns_pkg"
-        self.assertTrue(proj.exists())
 
-
-class TestPluginFrameworkTemplateStructure(unittest.TestCase):
+class TestPluginFrameworkTemplateStructure:
     """Plugin framework template generates plugin structure."""
 
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-
-    def test_plugin_framework_generates(self):
-        result = self.generator.generate_project(
-            project_name="plug_fw",
-            output_dir=self.temp_dir,
-            template_id="plugin-framework",
-            features=DEFAULT_FEATURES,
-            metadata=METADATA,
-        )
-        self.assertTrue(result)
-        proj = self.temp_dir / "plug_fw"
-        self.assertTrue(proj.exists())
+    def test_plugin_framework_generates(self, generated_project, default_features, metadata):
+        proj = generated_project("plugin-framework", "plug_fw", default_features, metadata)
+        assert proj.exists()
         files = list(proj.rglob("*.py"))
-        self.assertTrue(len(files) > 0, "Plugin framework should generate Python files")
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert len(files) > 0, "Plugin framework should generate Python files"
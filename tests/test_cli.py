@@ -5,19 +5,31 @@ Covers: --gui flag, --cli flag, --version flag, --help output,
         CLI project generation workflow, and invalid argument handling.
 """
 
+import runpy
 import sys
 import unittest
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-_ROOT = Path(__file__).resolve().parents[1]
-_SRC = _ROOT / "src"
-if str(_SRC) not in sys.path:
-    sys.path.insert(0, str(_SRC))
+import pytest
 
 from python_project_generator.__main__ import main
 
 
+@pytest.fixture
+def no_wx():
+    """Make ``import wx`` raise ImportError for the duration of a test.
+
+    A ``None`` entry in sys.modules makes the import system treat wx as
+    unavailable, so ``builtins.__import__`` does not need patching.
+    """
+    saved_wx = sys.modules.pop("wx", None)
+    sys.modules["wx"] = None
+    yield
+    del sys.modules["wx"]
+    if saved_wx is not None:
+        sys.modules["wx"] = saved_wx
+
+
 class TestVersionAndHelp(unittest.TestCase):
     """Tests for --version and --help flags."""
 
@@ -91,6 +103,7 @@ class TestCLIFlag(unittest.TestCase):
 class TestGUIFlag(unittest.TestCase):
     """Tests for --gui / default GUI launch path."""
 
+    @pytest.mark.usefixtures("no_wx")
     def test_gui_returns_1_when_wx_missing(self):
         """Default path (no --cli) returns 1 when wxPython is not installed."""
         args = MagicMock(cli=False, gui=False)
@@ -98,40 +111,15 @@ class TestGUIFlag(unittest.TestCase):
             "python_project_generator.__main__.argparse.ArgumentParser.parse_known_args",
             return_value=(args, []),
         ):
-            real_import = __import__
-
-            def no_wx_import(name, globals=None, locals=None, fromlist=(), level=0):
-                if name == "wx":
-                    raise ImportError("No module named 'wx'")
-                return real_import(name, globals, locals, fromlist, level)
-
-            saved_wx = sys.modules.pop("wx", None)
-            try:
-                with patch("builtins.__import__", side_effect=no_wx_import):
-                    result = main()
-                self.assertEqual(result, 1)
-            finally:
-                if saved_wx is not None:
-                    sys.modules["wx"] = saved_wx
+            result = main()
+        self.assertEqual(result, 1)
 
+    @pytest.mark.usefixtures("no_wx")
     def test_gui_flag_attempts_wx_import(self):
         """--gui path tries to import wx; when missing, returns 1 with helpful message."""
         with patch("sys.argv", ["prog", "--gui"]):
-            real_import = __import__
-
-            def no_wx(name, globals=None, locals=None, fromlist=(), level=0):
-                if name == "wx":
-                    raise ImportError("No module named 'wx'")
-                return real_import(name, globals, locals, fromlist, level)
-
-            saved_wx = sys.modules.pop("wx", None)
-            try:
-                with patch("builtins.__import__", side_effect=no_wx):
-                    result = main()
-                self.assertEqual(result, 1)
-            finally:
-                if saved_wx is not None:
-                    sys.modules["wx"] = saved_wx
+            result = main()
+        self.assertEqual(result, 1)
 
 
 class TestCLIProjectGeneration(unittest.TestCase):
@@ -175,6 +163,7 @@ class TestModuleExecution(unittest.TestCase):
         """main() is importable and callable."""
         self.assertTrue(callable(main))
 
+    @pytest.mark.usefixtures("no_wx")
     def test_main_returns_int_on_wx_missing(self):
         """main() returns an integer exit code when wx is unavailable."""
         args = MagicMock(cli=False, gui=False)
@@ -182,29 +171,19 @@ class TestModuleExecution(unittest.TestCase):
             "python_project_generator.__main__.argparse.ArgumentParser.parse_known_args",
             return_value=(args, []),
         ):
-            real_import = __import__
-
-            def no_wx(name, globals=None, locals=None, fromlist=(), level=0):
-                if name == "wx":
-                    raise ImportError("no wx")
-                return real_import(name, globals, locals, fromlist, level)
-
-            saved_wx = sys.modules.pop("wx", None)
-            try:
-                with patch("builtins.__import__", side_effect=no_wx):
-                    result = main()
-            finally:
-                if saved_wx is not None:
-                    sys.modules["wx"] = saved_wx
+            result = main()
         self.assertIsInstance(result, int)
 
     def test_if_name_main_block(self):
-        """The module has a __name__ == '__main__' guard."""
-        import inspect
-        import python_project_generator.__main__ as mod
-
-        source = inspect.getsource(mod)
-        self.assertIn('if __name__ == "__main__"', source)
+        """Running the package as __main__ passes main()'s return value to sys.exit."""
+        with patch("sys.argv", ["prog", "--cli"]), patch(
+            "python_project_generator.project_generator.main", return_value=42
+        ), patch.dict(sys.modules):
+            # Drop the already-imported module so runpy executes it fresh without warning.
+            sys.modules.pop("python_project_generator.__main__", None)
+            with self.assertRaises(SystemExit) as ctx:
+                runpy.run_module("python_project_generator", run_name="__main__")
+        self.assertEqual(ctx.exception.code, 42)
 
 
 if __name__ == "__main__":
@@ -6,39 +6,76 @@ files, and that project metadata (author, email, version, etc.) is properly
 injected into generated content.
 """
 
+import os
 import re
 import sys
-import tempfile
-import shutil
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-_ROOT = Path(__file__).resolve().parents[1]
-_SRC = _ROOT / "src"
-if str(_SRC) not in sys.path:
-    sys.path.insert(0, str(_SRC))
-
-from python_project_generator.project_generator import ProjectGenerator
-
-METADATA = {
-    "author": "Jane Doe",
-    "email": "jane@example.com",
-    "description": "A test project for feature flags",
-    "version": "2.5.0",
-}
+from types import MappingProxyType
+
+import pytest
+
+PROJECT_NAME = "flag_test_project"
+
+_UNRESOLVED_PLACEHOLDER_RE = re.compile(
+    rb"\{\{(project_name|author|email|description|version|package_name|class_name)\}\}"
+)
+
+# Extensions of generated files worth scanning; "" covers LICENSE, Makefile
+# and dotfiles such as .gitignore.
+_TEXT_SUFFIXES = frozenset({
+    "",
+    ".c",
+    ".cfg",
+    ".css",
+    ".h",
+    ".html",
+    ".in",
+    ".ini",
+    ".ipynb",
+    ".json",
+    ".md",
+    ".py",
+    ".rst",
+    ".toml",
+    ".txt",
+    ".yaml",
+    ".yml",
+})
+
+ALL_FEATURES = MappingProxyType({
+    "cli": True,
+    "tests": True,
+    "pypi_packaging": True,
+    "readme": True,
+    "changelog": True,
+    "gitignore": True,
+    "contributors": True,
+    "code_of_conduct": True,
+    "security": True,
+})
+
+NO_FEATURES = MappingProxyType({name: False for name in ALL_FEATURES})
+
+
+def _read_bytes_or_none(path):
+    """Return the bytes of path, or None if it cannot be read."""
+    try:
+        return path.read_bytes()
+    except PermissionError:
+        return None
 
 
 class _FeatureFlagTestBase(unittest.TestCase):
-    """Shared setup/teardown for feature-flag tests."""
-
-    def setUp(self):
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.project_name = "flag_test_project"
+    """Shared setup for feature-flag tests."""
 
-    def tearDown(self):
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, project_generator, metadata):
+        self.generator = project_generator
+        self.temp_dir = tmp_path
+        self.project_name = PROJECT_NAME
+        self.metadata = metadata
 
     def _generate(self, features):
         result = self.generator.generate_project(
@@ -46,119 +83,140 @@ class _FeatureFlagTestBase(unittest.TestCase):
             output_dir=self.temp_dir,
             template_id="minimal-python",
             features=features,
-            metadata=METADATA,
+            metadata=self.metadata,
         )
         self.assertTrue(result, "generate_project should return True")
         return self.temp_dir / self.project_name
 
-
-class TestFeatureFlagEnablesFile(_FeatureFlagTestBase):
-    """Each feature flag creates its corresponding files when enabled."""
+    @staticmethod
+    def _all_text_files(root: Path):
+        """Yield (path, raw bytes) for every readable text file under root.
+
+        Walks with os.scandir so file/dir checks use the cached entry type
+        instead of an extra stat per path, then reads the files on a small
+        thread pool so their read latency overlaps. Files whose extension is
+        not in _TEXT_SUFFIXES (e.g. .pyc, images) are never opened.
+        """
+        paths = []
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (
+                        entry.is_file(follow_symlinks=False)
+                        and os.path.splitext(entry.name)[1] in _TEXT_SUFFIXES
+                    ):
+                        paths.append(Path(entry.path))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for path, data in zip(paths, executor.map(_read_bytes_or_none, paths)):
+                if data is not None:
+                    yield path, data
+
+
+@pytest.fixture(scope="class")
+def all_features_project(request, generated_project, metadata):
+    """Expose the shared every-flag-on project as ``project`` on the class."""
+    request.cls.project = generated_project("minimal-python", PROJECT_NAME, ALL_FEATURES, metadata)
+
+
+@pytest.fixture(scope="class")
+def no_features_project(request, generated_project, metadata):
+    """Expose the shared every-flag-off project as ``project`` on the class."""
+    request.cls.project = generated_project("minimal-python", PROJECT_NAME, NO_FEATURES, metadata)
+
+
+@pytest.mark.usefixtures("all_features_project")
+class TestFeatureFlagEnablesFile(unittest.TestCase):
+    """Each feature flag creates its corresponding files when enabled.
+
+    All checks run against one shared project with every flag on.
+    """
 
     def test_cli_flag_creates_cli_module(self):
-        project = self._generate({"cli": True})
-        package_dir = project / "src" / "flag_test_project"
         self.assertTrue(
-            (package_dir / "cli.py").exists(),
+            (self.project / "src" / PROJECT_NAME / "cli.py").exists(),
             "cli=True should create cli.py",
         )
 
     def test_tests_flag_creates_test_directory(self):
-        project = self._generate({"tests": True})
         self.assertTrue(
-            (project / "tests").exists(),
+            (self.project / "tests").exists(),
             "tests=True should create tests/ directory",
         )
 
     def test_pypi_packaging_creates_setup_files(self):
-        project = self._generate({"pypi_packaging": True})
-        has_setup = (project / "setup.py").exists() or (project / "pyproject.toml").exists()
-        self.assertTrue(has_setup, "pypi_packaging=True should create setup.py or pyproject.toml")
+        self.assertTrue(
+            (self.project / "setup.py").exists() or (self.project / "pyproject.toml").exists(),
+            "pypi_packaging=True should create setup.py or pyproject.toml",
+        )
 
     def test_readme_flag_creates_readme(self):
-        project = self._generate({"readme": True})
         self.assertTrue(
-            (project / "README.md").exists(),
+            (self.project / "README.md").exists(),
             "readme=True should create README.md",
         )
 
     def test_changelog_flag_creates_changelog(self):
-        project = self._generate({"changelog": True})
         self.assertTrue(
-            (project / "CHANGELOG.md").exists(),
+            (self.project / "CHANGELOG.md").exists(),
             "changelog=True should create CHANGELOG.md",
         )
 
     def test_gitignore_flag_creates_gitignore(self):
-        project = self._generate({"gitignore": True})
         self.assertTrue(
-            (project / ".gitignore").exists(),
+            (self.project / ".gitignore").exists(),
             "gitignore=True should create .gitignore",
         )
 
     def test_contributors_flag_creates_file(self):
-        project = self._generate({"contributors": True})
         self.assertTrue(
-            (project / "CONTRIBUTORS.md").exists(),
+            (self.project / "CONTRIBUTORS.md").exists(),
             "contributors=True should create CONTRIBUTORS.md",
         )
 
     def test_code_of_conduct_flag_creates_file(self):
-        project = self._generate({"code_of_conduct": True})
         self.assertTrue(
-            (project / "CODE_OF_CONDUCT.md").exists(),
+            (self.project / "CODE_OF_CONDUCT.md").exists(),
             "code_of_conduct=True should create CODE_OF_CONDUCT.md",
         )
 
     def test_security_flag_creates_file(self):
-        project = self._generate({"security": True})
         self.assertTrue(
-            (project / "SECURITY.md").exists(),
+            (self.project / "SECURITY.md").exists(),
             "security=True should create SECURITY.md",
         )
 
 
-class TestFeatureFlagDisablesFile(_FeatureFlagTestBase):
-    """Disabled feature flags should NOT create their corresponding files."""
+@pytest.mark.usefixtures("no_features_project")
+class TestFeatureFlagDisablesFile(unittest.TestCase):
+    """Disabled feature flags should NOT create their corresponding files.
 
-    ALL_OFF = {
-        "cli": False,
-        "tests": False,
-        "pypi_packaging": False,
-        "readme": False,
-        "changelog": False,
-        "gitignore": False,
-        "contributors": False,
-        "code_of_conduct": False,
-        "security": False,
-    }
+    All checks run against one shared project with every flag off.
+    """
 
     def test_no_cli_when_disabled(self):
-        project = self._generate(self.ALL_OFF)
-        package_dir = project / "src" / "flag_test_project"
         self.assertFalse(
-            (package_dir / "cli.py").exists(),
+            (self.project / "src" / PROJECT_NAME / "cli.py").exists(),
             "cli=False should not create cli.py",
         )
 
     def test_no_tests_when_disabled(self):
-        project = self._generate(self.ALL_OFF)
         self.assertFalse(
-            (project / "tests").exists(),
+            (self.project / "tests").exists(),
             "tests=False should not create tests/ directory",
         )
 
     def test_no_readme_when_disabled(self):
-        project = self._generate(self.ALL_OFF)
         self.assertFalse(
-            (project / "README.md").exists(),
+            (self.project / "README.md").exists(),
             "readme=False should not create README.md",
         )
 
     def test_no_gitignore_when_disabled(self):
-        project = self._generate(self.ALL_OFF)
         self.assertFalse(
-            (project / ".gitignore").exists(),
+            (self.project / ".gitignore").exists(),
             "gitignore=False should not create .gitignore",
         )
 
@@ -173,18 +231,7 @@ class TestFeatureCombinations(_FeatureFlagTestBase):
         self.assertTrue((project / "tests").exists())
 
     def test_full_feature_set(self):
-        all_on = {
-            "cli": True,
-            "tests": True,
-            "pypi_packaging": True,
-            "readme": True,
-            "changelog": True,
-            "gitignore": True,
-            "contributors": True,
-            "code_of_conduct": True,
-            "security": True,
-        }
-        project = self._generate(all_on)
+        project = self._generate(ALL_FEATURES)
         package_dir = project / "src" / "flag_test_project"
         self.assertTrue((package_dir / "cli.py").exists())
         self.assertTrue((project / "tests").exists())
@@ -202,34 +249,30 @@ class TestFeatureCombinations(_FeatureFlagTestBase):
         self.assertFalse((project / "README.md").exists())
 
 
+@pytest.fixture(scope="class")
+def generated_with_all_features(request, generated_project, metadata):
+    """Read the shared every-flag-on project's files once per class.
+
+    Sets ``all_features_project`` and ``all_features_files`` (a list of
+    ``(path, bytes)`` pairs) on the requesting test class.
+    """
+    project = generated_project("minimal-python", PROJECT_NAME, ALL_FEATURES, metadata)
+    request.cls.all_features_project = project
+    request.cls.all_features_files = list(request.cls._all_text_files(project))
+
+
+@pytest.mark.usefixtures("generated_with_all_features")
 class TestMetadataPlaceholderReplacement(_FeatureFlagTestBase):
     """Metadata values are injected into generated files correctly."""
 
-    def _all_text_files(self, root: Path):
-        """Yield (path, content) for every text file under root."""
-        for p in root.rglob("*"):
-            if p.is_file():
-                try:
-                    yield p, p.read_text(encoding="utf-8")
-                except (UnicodeDecodeError, PermissionError):
-                    continue
-
     def test_author_appears_in_generated_files(self):
-        project = self._generate({"readme": True, "pypi_packaging": True})
-        found_author = False
-        for _, content in self._all_text_files(project):
-            if METADATA["author"] in content:
-                found_author = True
-                break
+        author = self.metadata["author"].encode()
+        found_author = any(author in data for _, data in self.all_features_files)
         self.assertTrue(found_author, "Author name should appear in at least one generated file")
 
     def test_email_appears_in_generated_files(self):
-        project = self._generate({"pypi_packaging": True})
-        found_email = False
-        for _, content in self._all_text_files(project):
-            if METADATA["email"] in content:
-                found_email = True
-                break
+        email = self.metadata["email"].encode()
+        found_email = any(email in data for _, data in self.all_features_files)
         self.assertTrue(found_email, "Email should appear in at least one generated file")
 
     def test_version_appears_in_init(self):
@@ -237,30 +280,22 @@ class TestMetadataPlaceholderReplacement(_FeatureFlagTestBase):
         init_file = project / "src" / "flag_test_project" / "__init__.py"
         self.assertTrue(init_file.exists())
         content = init_file.read_text()
-        self.assertIn(METADATA["version"], content)
+        self.assertIn(self.metadata["version"], content)
 
     def test_description_appears_in_init(self):
         project = self._generate({})
         init_file = project / "src" / "flag_test_project" / "__init__.py"
         content = init_file.read_text()
-        self.assertIn(METADATA["description"], content)
+        self.assertIn(self.metadata["description"], content)
 
     def test_no_unresolved_placeholder_patterns(self):
         """No {{placeholder}} patterns should remain in generated files."""
-        project = self._generate({
-            "cli": True,
-            "tests": True,
-            "pypi_packaging": True,
-            "readme": True,
-            "changelog": True,
-            "gitignore": True,
-        })
-        unresolved_pattern = re.compile(r"\{\{(project_name|author|email|description|version|package_name|class_name)\}\}")
+        project = self.all_features_project
         violations = []
-        for path, content in self._all_text_files(project):
-            matches = unresolved_pattern.findall(content)
-            if matches:
-                violations.append((path.relative_to(project), matches))
+        for path, data in self.all_features_files:
+            match = _UNRESOLVED_PLACEHOLDER_RE.search(data)
+            if match:
+                violations.append((path.relative_to(project), match.group().decode()))
         self.assertEqual(
             violations,
             [],
@@ -279,4 +314,4 @@ class TestMetadataPlaceholderReplacement(_FeatureFlagTestBase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    sys.exit(pytest.main([__file__]))
@@ -3,21 +3,11 @@ Tests for the project generator module.
 """
 
 import unittest
-import tempfile
-import shutil
-from pathlib import Path
 import sys
 
-
-# Ensure src/ is on sys.path when running this file directly with `python tests/...`
-_ROOT = Path(__file__).resolve().parents[1]
-_SRC = _ROOT / "src"
-if str(_SRC) not in sys.path:
-    sys.path.insert(0, str(_SRC))
+import pytest
 
 from python_project_generator.project_generator import (
-    ProjectGenerator,
-    TemplateManager,
     _BUILTIN_TEMPLATE_GENERATOR_PILOT,
     setup_logging,
 )
@@ -26,10 +16,11 @@ from python_project_generator.project_generator import (
 class TestTemplateManager(unittest.TestCase):
     """Test the TemplateManager class."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, template_manager):
         """Set up test fixtures."""
 
-        self.template_manager = TemplateManager()
+        self.template_manager = template_manager
     
     def test_get_available_templates(self):
         """Test getting available templates."""
@@ -51,17 +42,12 @@ class TestTemplateManager(unittest.TestCase):
 class TestProjectGenerator(unittest.TestCase):
     """Test the ProjectGenerator class."""
     
-    def setUp(self):
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path, project_generator):
         """Set up test fixtures."""
 
-        self.generator = ProjectGenerator()
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+        self.generator = project_generator
+        self.temp_dir = tmp_path
     
     def test_generate_minimal_project(self):
         """Test generating a minimal project."""
@@ -241,4 +227,4 @@ class TestProjectGenerator(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    sys.exit(pytest.main([__file__])) 
\ No newline at end of file